@@ -18,7 +18,8 @@ Key Features:
 Security Implementation:
 - Uses secrets module instead of random for CSPRNG (Cryptographically Secure 
   Pseudorandom Number Generator)
-- Guarantees uniform distribution of selected character types
+- Guarantees uniform distribution of selected character types (rejection
+  sampling over a single bulk token_bytes() draw, no modulo bias)
 - Raises explicit error for invalid configurations
 
 Usage Examples:
@@ -31,14 +32,99 @@ Usage Examples:
 3. Numeric PIN code:
    generate_password(length=6, use_upper=False, use_lower=False, use_symbols=False)
 
+4. Batch of 100 passwords with the same settings:
+   generate_passwords(100, length=16)
+
 The module follows security best practices by:
 - Avoiding predictable patterns in password generation
 - Using cryptographically strong random number generation
 - Providing clear validation for configuration errors
 """
 
-import string   # For character sets
-import secrets  # For cryptographically secure random generation
+import string                      # For character sets
+import secrets                     # For cryptographically secure random generation
+from functools import lru_cache    # For reusing per-charset lookup tables
+
+
+@lru_cache(maxsize=16)
+def _sampling_table(characters):
+
+    """
+    Build the byte translation table used to map random bytes onto a charset.
+
+    Args:
+        characters (str): ASCII character set to sample from
+
+    Returns:
+        tuple: (table, rejected) where:
+            table (bytes): 256-byte table for bytes.translate() mapping
+                byte b to characters[b % len(characters)]
+            rejected (bytes): Byte values at or above the largest multiple
+                of len(characters), deleted before translation to keep
+                the distribution uniform
+    """
+
+    k = len(characters)
+    cutoff = 256 - (256 % k)
+    table = bytes(ord(characters[b % k]) if b < cutoff else 0 for b in range(256))
+    return table, bytes(range(cutoff, 256))
+
+
+# Every combination of the four character types, indexed by the bit mask
+# upper=8, lower=4, digits=2, symbols=1 (index 0 is the empty selection)
+_CHARSETS = tuple(
+    (string.ascii_uppercase if mask & 8 else '')
+    + (string.ascii_lowercase if mask & 4 else '')
+    + (string.digits if mask & 2 else '')
+    + (string.punctuation if mask & 1 else '')
+    for mask in range(16)
+)
+
+
+def _select_characters(use_upper, use_lower, use_digits, use_symbols):
+
+    """
+    Look up the precomputed character pool for the selected character types.
+
+    Returns:
+        str: Concatenated character set
+
+    Raises:
+        ValueError: If no character sets are selected
+    """
+
+    mask = (bool(use_upper) << 3) | (bool(use_lower) << 2) | (bool(use_digits) << 1) | bool(use_symbols)
+    if not mask:
+        raise ValueError("At least one character type must be selected.")
+    return _CHARSETS[mask]
+
+
+def _sample(characters, count):
+
+    """
+    Draw count uniformly distributed characters from the charset.
+
+    Args:
+        characters (str): ASCII character set to sample from
+        count (int): Number of characters to draw
+
+    Returns:
+        bytearray: ASCII-encoded random characters
+    """
+
+    # Draw entropy in bulk; bytes.translate() drops the rejected bytes and
+    # maps the rest onto the charset in a single C-level pass. This is also
+    # why SystemRandom().choices() is not used: it calls random() once per
+    # character, and each call is a separate os.urandom() read.
+    # Refills extend one bytearray in place, and the surplus is
+    # trimmed without copying the accepted bytes again
+    table, rejected = _sampling_table(characters)
+    sample = bytearray()
+    while len(sample) < count:
+        raw = secrets.token_bytes((count - len(sample)) * 2)
+        sample += raw.translate(table, rejected)
+    del sample[count:]
+    return sample
 
 
 def generate_password(length=12, use_upper=True, use_lower=True, use_digits=True, use_symbols=True):
@@ -65,17 +151,36 @@ def generate_password(length=12, use_upper=True, use_lower=True, use_digits=True
 
     """
     
-    characters = ''
-    if use_upper:
-        characters += string.ascii_uppercase
-    if use_lower:
-        characters += string.ascii_lowercase
-    if use_digits:
-        characters += string.digits
-    if use_symbols:
-        characters += string.punctuation
-
-    if not characters:
-        raise ValueError("At least one character type must be selected.")
+    # Numeric PINs take the same path: it is already a single bulk CSPRNG
+    # draw, and drawing the PIN as one integer measured no faster
+    characters = _select_characters(use_upper, use_lower, use_digits, use_symbols)
+    return _sample(characters, length).decode('ascii')
+
+
+def generate_passwords(count, length=12, use_upper=True, use_lower=True, use_digits=True, use_symbols=True):
+
+    """
+    Generate several independent passwords sharing the same settings.
+
+    Args:
+        count (int): Number of passwords to generate
+        length (int): Desired length of each password (default: 12)
+        use_upper (bool): Include uppercase letters (default: True)
+        use_lower (bool): Include lowercase letters (default: True)
+        use_digits (bool): Include digits (default: True)
+        use_symbols (bool): Include symbols (default: True)
+
+    Returns:
+        list: Generated passwords (str)
+
+    Raises:
+        ValueError: If no character sets are selected
+
+    Performance:
+        Entropy for the whole batch is drawn and mapped in one pass, then
+        sliced into passwords, instead of one round trip per password.
+    """
 
-    return ''.join(secrets.choice(characters) for _ in range(length))
+    characters = _select_characters(use_upper, use_lower, use_digits, use_symbols)
+    sample = _sample(characters, count * length)
+    return [sample[i * length:(i + 1) * length].decode('ascii') for i in range(count)]
@@ -18,7 +18,7 @@ Key Features:
    - One-click copy to clipboard
 
 2. Security Implementation:
-   - Real-time password strength assessment (0-4 scale)
+   - Real-time password strength assessment (0-4 scale), debounced while typing
    - Color-coded strength meter (red-yellow-green)
    - AES-256 encrypted password storage
    - Secure memory handling for sensitive data
@@ -48,7 +48,7 @@ Technical Architecture:
 Core Components:
 - generate_password: Secure password generation core
 - check_strength: Complexity and vulnerability analysis
-- encrypt_and_save: AES-256 encrypted storage
+- append_encrypted: AES-256 encrypted storage (append-only vault)
 - load_and_decrypt: Secure credential retrieval
 - SAVED_PASSWORDS: In-memory encrypted password cache
 
@@ -94,10 +94,20 @@ from tkinter import messagebox
 import tkinter as tk
 import pyperclip
 from generator import generate_password
-from strength_checker import check_strength
-from storage import encrypt_and_save, load_and_decrypt
+from strength_checker import check_strength, clear_cache, warm_up
+from storage import append_encrypted, load_and_decrypt, forget_key
 
 SAVED_PASSWORDS = {}
+# Progress bar style for each zxcvbn score (0-4)
+STRENGTH_STYLES = (
+    "Red.Horizontal.TProgressbar",
+    "Red.Horizontal.TProgressbar",
+    "Yellow.Horizontal.TProgressbar",
+    "Green.Horizontal.TProgressbar",
+    "Green.Horizontal.TProgressbar",
+)
+STRENGTH_DEBOUNCE_MS = 150  # Quiet period before re-scoring a typed password
+WARM_UP_DELAY_MS = 100      # Lets the window appear before zxcvbn is loaded
 
 def save_password(label, password):
 
@@ -110,18 +120,19 @@ def save_password(label, password):
         
     Process:
     1. Updates the in-memory password dictionary
-    2. Encrypts and writes all passwords to disk
+    2. Encrypts the new entry and appends it to the vault on disk
     3. Shows success confirmation
     
     Security:
     - Passwords are encrypted before storage
     - Maintains only one encrypted copy in memory
-    - Uses authenticated encryption (Fernet)
+    - Uses authenticated encryption (AES-GCM)
+    - The entry is on disk (fsynced) before success is reported
     """
         
     global SAVED_PASSWORDS
     SAVED_PASSWORDS[label] = password
-    encrypt_and_save(SAVED_PASSWORDS)
+    append_encrypted(label, password)
     messagebox.showinfo("Saved", f"Password for '{label}' was saved successfully.")
 
 def validate_length(length_str):
@@ -175,17 +186,50 @@ def update_strength(pw, label_widget, bar_widget):
     Technical:
     - Uses zxcvbn algorithm for realistic strength estimation
     - Updates both textual and visual indicators
+    - Restyles the bar only when its color actually changes
+    - An empty password resets the meter without calling zxcvbn
     """
 
-    score, feedback = check_strength(pw)
-    label_widget.config(text=f"Strength: {score}/4\n{feedback['warning']}")
-    bar_widget['value'] = score * 25
-    if score >= 3:
-        bar_widget.configure(style="Green.Horizontal.TProgressbar")
-    elif score == 2:
-        bar_widget.configure(style="Yellow.Horizontal.TProgressbar")
+    if pw:
+        score, feedback = check_strength(pw)
+        text = f"Strength: {score}/4\n{feedback['warning']}"
     else:
-        bar_widget.configure(style="Red.Horizontal.TProgressbar")
+        # zxcvbn cannot score an empty string; show the initial meter instead
+        score, text = 0, "Strength: 0/4"
+    label_widget.config(text=text)
+    bar_widget['value'] = score * 25
+    style_name = STRENGTH_STYLES[score]
+    if getattr(bar_widget, '_last_style', None) != style_name:
+        bar_widget.configure(style=style_name)
+        bar_widget._last_style = style_name
+
+def schedule_strength_update(root, pw, label_widget, bar_widget, delay=STRENGTH_DEBOUNCE_MS):
+
+    """
+    Debounces strength meter updates so zxcvbn runs once per burst of input.
+    
+    Args:
+        root (tk.Tk): The main application window, used for scheduling
+        pw (str): The password to evaluate
+        label_widget (ttk.Label): GUI label to display strength text
+        bar_widget (ttk.Progressbar): GUI progress bar for visual feedback
+        delay (int): Milliseconds to wait before scoring (default: 150)
+        
+    Behavior:
+    - Cancels any update still pending from an earlier call
+    - Schedules update_strength() after the delay
+    - Only the last call within the delay window is scored
+    - An empty password resets the meter immediately
+    """
+
+    pending = getattr(root, '_strength_after_id', None)
+    if pending is not None:
+        root.after_cancel(pending)
+        root._strength_after_id = None
+    if not pw:
+        update_strength(pw, label_widget, bar_widget)
+        return
+    root._strength_after_id = root.after(delay, update_strength, pw, label_widget, bar_widget)
 
 def toggle_password_visibility(entry_widget, toggle_btn):
 
@@ -228,6 +272,11 @@ def view_passwords(root):
     - Passwords are visible only in this protected view
     - Window is non-resizable to prevent UI issues
     - No editing capability in the viewer
+
+    Performance:
+    - Window stays withdrawn while rows are inserted, so it is drawn once
+    - Rows go straight to the Tcl insert command, skipping the Python
+      option formatting done by Treeview.insert()
     """
 
     if not SAVED_PASSWORDS:
@@ -235,6 +284,7 @@ def view_passwords(root):
         return
 
     view_win = tk.Toplevel(root)
+    view_win.withdraw()
     view_win.title("Saved Passwords")
     view_win.resizable(False, False)
 
@@ -243,10 +293,12 @@ def view_passwords(root):
     tree.heading("Password", text="Password")
     tree.pack(padx=10, pady=10)
 
+    insert = tree.tk.call
     for label, pw in SAVED_PASSWORDS.items():
-        tree.insert("", "end", values=(label, pw))
+        insert(tree, "insert", "", "end", "-values", (label, pw))
 
     ttk.Button(view_win, text="Close", command=view_win.destroy).pack(pady=5)
+    view_win.deiconify()
 
 def launch_app():
 
@@ -344,6 +396,8 @@ def launch_app():
                           command=lambda: toggle_password_visibility(password_entry, toggle_btn),
                           width=6)
     toggle_btn.pack(side='left')
+    password_entry.bind('<KeyRelease>', lambda event: schedule_strength_update(
+        root, password_var.get(), strength_label, strength_bar))
 
     # Generate button and strength meter on same line
     gen_strength_frame = ttk.Frame(frame)
@@ -391,8 +445,12 @@ def launch_app():
             return
         pw = generate_password(length, upper_var.get(), lower_var.get(), digits_var.get(), symbols_var.get())
         password_var.set(pw)
-        pyperclip.copy(pw)
-        update_strength(pw, strength_label, strength_bar)
+        try:
+            pyperclip.copy(pw)
+        except pyperclip.PyperclipException:
+            pass  # No usable clipboard; the password is still shown in the entry
+        # Scored on the next event-loop tick so the new password shows first
+        schedule_strength_update(root, pw, strength_label, strength_bar, delay=0)
 
     def save_password_handler():
         label = label_entry.get()
@@ -402,4 +460,7 @@ def launch_app():
             return
         save_password(label, pw)
 
-    root.mainloop()
\ No newline at end of file
+    root.after(WARM_UP_DELAY_MS, warm_up)
+    root.mainloop()
+    forget_key()
+    clear_cache()
\ No newline at end of file
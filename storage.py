@@ -3,19 +3,20 @@ Secure Password Storage Module
 -----------------------------
 
 This module provides encrypted storage for password data using industry-standard
-cryptographic practices. It implements secure file-based storage with Fernet
-symmetric encryption (AES-128-CBC with PKCS7 padding) and proper key management.
+cryptographic practices. It implements secure file-based storage with AES-GCM
+authenticated encryption (AES-256, hardware accelerated through OpenSSL) and
+proper key management.
 
 Security Features:
 -----------------------------
-- AES-128 encryption via Fernet (cryptography library)
+- AES-256-GCM encryption via AESGCM (cryptography library)
 - Automatic key generation and management
 - Encrypted JSON serialization
 - Protection against common cryptographic vulnerabilities:
   * Key stored separately from encrypted data
   * Secure key generation (cryptographically random)
-  * Message authentication (HMAC)
-  * Timestamp verification
+  * Message authentication (GCM tag)
+  * Fresh random nonce for every encryption
 
 Implementation Details:
 -----------------------------
@@ -26,33 +27,56 @@ Implementation Details:
 
 2. Data Storage:
    - Uses JSON serialization for structured data
-   - Encrypts entire payload rather than individual items
+   - Append-only log of encrypted frames: a full save writes one frame
+     with every entry, a single save appends one small frame
+   - Frames are merged in order on load (last write wins) and the log is
+     compacted back to one frame once it grows past COMPACT_THRESHOLD
    - Outputs binary encrypted file (passwords.enc)
 
 3. Cryptographic Operations:
-   - Encryption: Fernet.encrypt() with current timestamp
+   - Encryption: AESGCM.encrypt() with a random 12-byte nonce
    - Decryption: Includes automatic validation of:
-     * HMAC signature
-     * Token expiration (not enforced by default)
+     * GCM authentication tag
      * Correct decryption key
+   - AESGCM goes straight to OpenSSL's EVP layer, which uses AES-NI and
+     carry-less multiply (PCLMULQDQ) on x86_64 and the ARMv8 crypto
+     extensions on aarch64
+
+4. Legacy Vaults:
+   - Vaults written by older versions are Fernet tokens (AES-128-CBC + HMAC)
+   - They are still read transparently and are rewritten as AES-GCM
+     append logs on the next save
 
 File Structure:
 -----------------------------
 secret.key        - Encryption key (32 bytes, base64)
-passwords.enc     - Encrypted password data (JSON format)
+passwords.enc     - Encrypted password data (JSON format):
+                    b'PGV2' header, then one or more frames of
+                    4-byte length + 12-byte nonce + ciphertext + 16-byte tag
+passwords.enc.tmp - Short-lived staging file during full rewrites
+passwords.enc.bak - Copy of the vault taken before a torn tail is dropped
 
 API Reference:
 -----------------------------
-encrypt_and_save(data: dict) -> None
+encrypt_and_save(data: dict, sync: bool = True) -> None
     - Encrypts and saves password dictionary
     - Args: Python dictionary of {label: password} pairs
-    - Writes to passwords.enc
+    - Writes passwords.enc.tmp, then atomically replaces passwords.enc
+
+append_many(entries: dict, sync: bool = True) -> None
+    - Adds or updates a batch of entries with one appended frame
+
+append_encrypted(label: str, password: str, sync: bool = True) -> None
+    - Adds or updates one entry by appending a frame to passwords.enc
 
 load_and_decrypt() -> dict
     - Loads and decrypts password data
     - Returns: Decrypted dictionary
     - Returns empty dict if no file exists
 
+forget_key() -> None
+    - Zeroes the cached key and drops the cipher (call on shutdown)
+
 Security Considerations:
 -----------------------------
 1. Key Protection:
@@ -68,8 +92,14 @@ Security Considerations:
    - Regular backups of encrypted data
 
 3. Limitations:
-   - Does not protect against memory scraping
+   - Does not protect against memory scraping. Only the cached base64
+     key is zeroed (by forget_key); the decoded raw AES key, key bytes
+     generated on first run, serialized and decrypted plaintext, Python
+     str copies and OpenSSL's internal key schedule are freed without
+     being wiped
    - No built-in key rotation
+   - Frames are authenticated individually, so someone with write access
+     to passwords.enc could drop trailing frames undetected
    - File-based storage only
 
 Dependencies:
@@ -77,11 +107,37 @@ Dependencies:
 - Python standard library
 """
 
-import json                             # For serialization
-from cryptography.fernet import Fernet  # For encryption
+import os      # For nonces
+import json    # For serialization
+import base64  # For key decoding
+import ctypes  # For zeroing sensitive buffers
+import mmap    # For zero-copy vault reads
+import shutil  # For backing up damaged vaults
+
+# cryptography is imported inside the functions that need it, so importing
+# this module (and starting the GUI with no vault yet) stays cheap
 
 KEY_FILE = 'secret.key'
 PASSWORD_FILE = 'passwords.enc'
+TEMP_FILE = PASSWORD_FILE + '.tmp'  # Staging file for atomic rewrites
+BACKUP_FILE = PASSWORD_FILE + '.bak'  # Original kept before a torn tail is dropped
+
+# Identifies append-log vaults written with AES-GCM; anything else is a
+# legacy Fernet token
+VAULT_HEADER = b'PGV2'
+NONCE_SIZE = 12
+TAG_SIZE = 16
+FRAME_LENGTH_SIZE = 4
+MIN_FRAME_SIZE = NONCE_SIZE + TAG_SIZE  # Shorter length fields mark a torn tail
+COMPACT_THRESHOLD = 64  # Appended frames tolerated before rewriting as one
+
+# Key material and cipher are loaded once per process and reused
+_KEY = None
+_CIPHER = None
+
+# (device, inode, size) of passwords.enc as last verified or written by this
+# process; appends are safe while the file still matches it
+_VAULT_STATE = None
 
 
 def load_key():
@@ -95,47 +151,298 @@ def load_key():
     - Secure key storage
 
     Returns:
-        bytes: 32-byte Fernet encryption key
+        bytearray: 44-byte base64 encoding of the 32-byte key, kept
+        mutable so forget_key() can zero it; the file is read straight
+        into it
+
+    Raises:
+        ValueError: If the key file exists but is empty
 
     Security Note:
         Generates cryptographically strong random key
         using system's CSPRNG when creating new key.
+        A new key file is written atomically and fsynced.
+
+    Performance:
+    - The key file is read at most once per process; later calls
+      return the cached key
     """
 
+    global _KEY
+    if _KEY is not None:
+        return _KEY
+
+    # Build the key in a local and cache it only once it is complete, so a
+    # failed or empty read is retried instead of sticking for the process
     try:
         with open(KEY_FILE, 'rb') as f:
-            return f.read()
+            key = bytearray(os.fstat(f.fileno()).st_size)
+            del key[f.readinto(key):]
     except FileNotFoundError:
-        key = Fernet.generate_key()
-        with open(KEY_FILE, 'wb') as f:
+        from cryptography.fernet import Fernet
+        key = bytearray(Fernet.generate_key())
+        with open(KEY_FILE + '.tmp', 'wb') as f:
             f.write(key)
-        return key
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(KEY_FILE + '.tmp', KEY_FILE)
+
+    if not key:
+        raise ValueError(f"Key file '{KEY_FILE}' is empty.")
+    _KEY = key
+    return _KEY
+
+
+def _wipe(buffer):
+
+    """
+    Overwrite a mutable buffer with zeros in place.
+
+    Args:
+        buffer (bytearray): Sensitive data to erase
+    """
+
+    if buffer:
+        ctypes.memset((ctypes.c_char * len(buffer)).from_buffer(buffer), 0, len(buffer))
+
+
+def forget_key():
+
+    """
+    Zero the cached base64 key and drop the cipher.
+
+    Security Note:
+        Call on shutdown. The next storage call reloads the key from
+        KEY_FILE. The raw key decoded for the cipher, copies held inside
+        OpenSSL and copies made by callers of load_key() are out of reach.
+    """
+
+    global _KEY, _CIPHER, _VAULT_STATE
+    _CIPHER = None
+    _VAULT_STATE = None  # Verified under the forgotten key; recheck on next use
+    if _KEY is not None:
+        _wipe(_KEY)
+        _KEY = None
+
+
+def _get_cipher():
+
+    """
+    Return the process-wide AES-GCM cipher, building it on first use.
+
+    The 32 random bytes inside the base64 key file are used directly
+    as an AES-256 key, so existing key files keep working.
+
+    Returns:
+        AESGCM: Cipher bound to the key from load_key()
+    """
+
+    global _CIPHER
+    if _CIPHER is None:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        _CIPHER = AESGCM(base64.urlsafe_b64decode(load_key()))
+    return _CIPHER
+
+
+def _stat_key(st):
+
+    """
+    Reduce an os.stat_result to what identifies the vault's contents.
+
+    Returns:
+        tuple: (st_dev, st_ino, st_size)
+    """
+
+    return st.st_dev, st.st_ino, st.st_size
+
+
+def _vault_state():
+
+    """
+    Return the current _stat_key() of passwords.enc, or None if missing.
+    """
+
+    try:
+        return _stat_key(os.stat(PASSWORD_FILE))
+    except FileNotFoundError:
+        return None
 
 
-def encrypt_and_save(data):
+def _encrypt_frame(data):
 
     """
-    Encrypt and securely store password data.
+    Encrypt a dictionary into one length-prefixed log frame.
+
+    Args:
+        data (dict): Entries to store in the frame {label: password}
+
+    Returns:
+        bytes: 4-byte little-endian length + nonce + ciphertext + tag
+    """
+
+    # Default ensure_ascii output is pure ASCII, so the encode is a straight
+    # copy; compact separators keep the plaintext (and ciphertext) small
+    payload = json.dumps(data, separators=(',', ':')).encode('ascii')
+    nonce = os.urandom(NONCE_SIZE)
+    frame = nonce + _get_cipher().encrypt(nonce, payload, None)
+    return len(frame).to_bytes(FRAME_LENGTH_SIZE, 'little') + frame
+
+
+def encrypt_and_save(data, sync=True):
+
+    """
+    Encrypt and securely store password data, replacing the whole vault.
     
     Args:
         data (dict): Password dictionary {label: password}
+        sync (bool): fsync before replacing the vault (default: True)
     
     Process:
     1. Serializes data to JSON
-    2. Encrypts with Fernet
-    3. Writes to secure file
+    2. Encrypts with AES-GCM under a fresh nonce
+    3. Writes header and a single frame to a temporary file
+    4. Atomically replaces passwords.enc with it (os.replace)
     
     Security Features:
-    - Includes timestamp in encryption
-    - Adds HMAC signature
-    - Uses AES-128-CBC with PKCS7 padding
+    - Never reuses a nonce (12 bytes from os.urandom)
+    - Adds GCM authentication tag
+    - Uses AES-256-GCM
+    - A crash mid-write leaves the previous vault intact
+
+    Note:
+        This also compacts the append log down to one frame.
+        With sync=False the replace is still atomic, but the new
+        contents may be lost on power failure.
+    """
+
+    global _VAULT_STATE
+    with open(TEMP_FILE, 'wb') as file:
+        file.write(VAULT_HEADER + _encrypt_frame(data))
+        file.flush()
+        if sync:
+            os.fsync(file.fileno())
+        state = _stat_key(os.fstat(file.fileno()))
+    os.replace(TEMP_FILE, PASSWORD_FILE)
+    _VAULT_STATE = state
+
+
+def append_many(entries, sync=True):
+
+    """
+    Add or update several passwords without rewriting the vault.
+    
+    Args:
+        entries (dict): Password dictionary {label: password}
+        sync (bool): fsync after appending (default: True)
+    
+    Process:
+    1. Encrypts all entries together as one frame
+    2. Appends the frame to the end of the vault
+    
+    Performance:
+    - Once this process has loaded or written the vault, an append is one
+      stat, one write and at most one fsync, whatever the vault's size
+    - If the file was not loaded yet or changed outside this process, it
+      is loaded and verified first, which is proportional to its size
+    - Missing or legacy Fernet vaults are converted with one full
+      rewrite instead of appended to
+    """
+
+    global _VAULT_STATE
+    if not entries:
+        return
+
+    if _VAULT_STATE is None or _vault_state() != _VAULT_STATE:
+        data = load_and_decrypt()  # Verifies the log and records its state
+        if _VAULT_STATE is None or _vault_state() != _VAULT_STATE:
+            data.update(entries)
+            encrypt_and_save(data, sync)
+            return
+
+    with open(PASSWORD_FILE, 'ab') as file:
+        file.write(_encrypt_frame(entries))
+        file.flush()
+        if sync:
+            os.fsync(file.fileno())
+        _VAULT_STATE = _stat_key(os.fstat(file.fileno()))
+
+
+def append_encrypted(label, password, sync=True):
+
+    """
+    Add or update a single password without rewriting the vault.
+    
+    Args:
+        label (str): Identifier for the password
+        password (str): The password to store
+        sync (bool): fsync after appending (default: True)
+    """
+
+    append_many({label: password}, sync)
+
+
+def _decode_vault(view):
+
+    """
+    Decrypt every frame of a vault held in memory.
+
+    Args:
+        view (memoryview): Whole contents of passwords.enc
+
+    Returns:
+        tuple: (data, frames, torn) where data is the merged password
+        dictionary, frames the number of frames decoded (None for a
+        legacy Fernet vault) and torn is True when an interrupted append
+        left a damaged tail after them
+
+    Raises:
+        InvalidTag: If the first frame, or any frame before the last,
+            fails to authenticate (wrong key or tampering)
+        ValueError: If the first frame is incomplete
+
+    Note:
+        Frames are decrypted from slices of the view, so no per-frame
+        copy of the ciphertext is made; only the 12-byte nonces are
+        copied. Slices are never bound to locals, so the mapping can
+        still be closed when decryption raises (e.g. InvalidTag).
+
+        Only appended frames can be torn: the first frame is written by
+        an atomic full rewrite, so any damage to it is an error. After
+        at least one good frame, the tail is torn when a length field is
+        shorter than MIN_FRAME_SIZE (e.g. zero-filled after a crash),
+        runs past the end of the file, or the final frame fails to
+        authenticate.
     """
 
-    key = load_key()
-    fernet = Fernet(key)
-    encrypted = fernet.encrypt(json.dumps(data).encode())
-    with open(PASSWORD_FILE, 'wb') as file:
-        file.write(encrypted)
+    if view[:len(VAULT_HEADER)] != VAULT_HEADER:
+        from cryptography.fernet import Fernet
+        return json.loads(Fernet(load_key()).decrypt(view.tobytes())), None, False
+
+    from cryptography.exceptions import InvalidTag
+
+    cipher = _get_cipher()
+    data = {}
+    frames = 0
+    offset = len(VAULT_HEADER)
+    while offset < len(view):
+        start = offset + FRAME_LENGTH_SIZE
+        length = int.from_bytes(view[offset:start], 'little')
+        end = start + length
+        if length < MIN_FRAME_SIZE or end > len(view):
+            if not frames:
+                raise ValueError("Vault is corrupted: first frame is incomplete.")
+            return data, frames, True
+        nonce = view[start:start + NONCE_SIZE].tobytes()
+        try:
+            plaintext = cipher.decrypt(nonce, view[start + NONCE_SIZE:end], None)
+        except InvalidTag:
+            if frames and end == len(view):
+                return data, frames, True
+            raise
+        data.update(json.loads(plaintext))
+        frames += 1
+        offset = end
+    return data, frames, False
 
 
 def load_and_decrypt():
@@ -148,20 +455,53 @@ def load_and_decrypt():
     
     Handles:
     - FileNotFoundError (returns empty dict)
+    - Appended frames (merged in order, later labels win)
+    - Torn tail from an interrupted append (dropped, see Maintenance)
+    - Legacy Fernet vaults (no PGV2 header)
     - Cryptographic verification:
-      * HMAC validation
-      * Token expiration check
+      * GCM tag validation (InvalidTag on wrong key or tampering)
+      * HMAC validation for legacy vaults
     
     Security:
     - Verifies data wasn't tampered with
-    - Validates encryption timestamp
+    - Never rewrites a vault it could not fully authenticate without
+      keeping the original as passwords.enc.bak
+
+    Performance:
+    - The vault is memory-mapped read-only rather than read into a new
+      bytes object, so frames are decrypted straight from the page cache
+
+    Maintenance:
+    - Rewrites the vault as a single frame once it holds more than
+      COMPACT_THRESHOLD frames
+    - A torn tail is dropped by copying the original file to
+      passwords.enc.bak and then rewriting the frames that decoded
     """
 
-    key = load_key()
-    fernet = Fernet(key)
+    global _VAULT_STATE
+    _VAULT_STATE = None
     try:
-        with open(PASSWORD_FILE, 'rb') as file:
-            encrypted = file.read()
-            return json.loads(fernet.decrypt(encrypted).decode())
+        file = open(PASSWORD_FILE, 'rb')
     except FileNotFoundError:
         return {}
+
+    with file:
+        state = _stat_key(os.fstat(file.fileno()))
+        if state[2] == 0:
+            # mmap cannot map an empty file
+            data, frames, torn = _decode_vault(memoryview(b''))
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    data, frames, torn = _decode_vault(view)
+
+    # Rewrite only after the mapping is closed; os.replace() cannot
+    # replace a mapped file on Windows
+    if torn:
+        shutil.copyfile(PASSWORD_FILE, BACKUP_FILE)
+        encrypt_and_save(data)
+    elif frames is not None and frames > COMPACT_THRESHOLD:
+        encrypt_and_save(data)
+    elif frames is not None:
+        _VAULT_STATE = state
+    return data
@@ -37,6 +37,12 @@ Technical Implementation:
 
 API Reference:
 -----------------------------
+warm_up() -> None
+    - Preloads zxcvbn so the first real check is fast
+
+clear_cache() -> None
+    - Forgets memoized results (they are keyed by plaintext password)
+
 check_strength(password: str) -> tuple(score: int, feedback: dict)
     - Args:
         password: The password string to evaluate
@@ -82,7 +88,30 @@ Dependencies:
 - Python >= 3.6
 """
 
-from zxcvbn import zxcvbn  # Password strength estimator
+from functools import lru_cache  # For memoizing repeated evaluations
+
+# zxcvbn loads its frequency lists on import, so it is imported on first use
+
+CACHE_SIZE = 256  # Most recent distinct passwords kept scored
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _evaluate(password):
+
+    """
+    Run zxcvbn once per distinct password and keep an immutable result.
+
+    Returns:
+        tuple: (score, frozen_feedback) where frozen_feedback is a tuple of
+        (key, value) pairs with list values converted to tuples, so cached
+        entries cannot be mutated by callers
+    """
+
+    from zxcvbn import zxcvbn  # Password strength estimator
+    result = zxcvbn(password)
+    frozen = tuple((key, tuple(value) if isinstance(value, list) else value)
+                   for key, value in result['feedback'].items())
+    return result['score'], frozen
 
 
 def check_strength(password):
@@ -111,10 +140,38 @@ def check_strength(password):
     
     Performance:
     - Typically executes in 1-10ms per password
+    - Repeated passwords are served from an LRU cache (see clear_cache)
     - Memory usage scales with password length
     """
 
-    result = zxcvbn(password)
-    score = result['score']
-    feedback = result['feedback']
+    score, frozen = _evaluate(password)
+    feedback = {key: list(value) if isinstance(value, tuple) else value
+                for key, value in frozen}
     return score, feedback
+
+
+def warm_up():
+
+    """
+    Import zxcvbn and run one throwaway evaluation ahead of time.
+
+    Loading the frequency lists (tens of ms) and the first matcher run
+    then happen before the user's first password is scored. The result
+    is not cached.
+    """
+
+    from zxcvbn import zxcvbn
+    zxcvbn("warmup")
+
+
+def clear_cache():
+
+    """
+    Drop all memoized results.
+
+    Security Note:
+        The cache is keyed by plaintext password; call this when the
+        application exits so scored passwords are not kept in memory.
+    """
+
+    _evaluate.cache_clear()